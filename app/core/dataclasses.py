@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from app.core.enums import RuleAction
 
 
-@dataclass
+@dataclass(slots=True)
 class Rule:
     id: str
     name: str
@@ -13,7 +13,7 @@ class Rule:
     action: RuleAction
 
 
-@dataclass
+@dataclass(slots=True)
 class SemgrepLangConfig:
     file_extension: str
     config_name: str | None = None
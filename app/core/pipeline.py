@@ -25,17 +25,22 @@ class BasePipeline(ABC):
 
     _identifier: str
     enabled: bool = False
+    _display_name: str | None = None
 
     def __str__(self) -> str:
         """
         String representation of the pipeline.
 
+        The spaced class name is computed once per class and cached, since
+        pipelines are stringified in log messages on every request.
+
         Returns:
             str: Class name of the pipeline
         """
-        class_name = self.__class__.__name__
-        spaced_name = re.sub(r"(?<!^)(?=[A-Z])", " ", class_name)
-        return spaced_name
+        if self.__class__._display_name is None:
+            class_name = self.__class__.__name__
+            self.__class__._display_name = re.sub(r"(?<!^)(?=[A-Z])", " ", class_name)
+        return self.__class__._display_name
 
     def __repr__(self) -> str:
         """
@@ -109,6 +114,8 @@ class BaseRulesPipeline(BasePipeline):
     _rules: list[Rule]
     _rules_dir_path: str | None = None
     _allowed_file_formats: tuple[str] = ("yml", "yaml")
+    _required_fields: tuple[str, ...] = ("uuid", "name", "details", "detection")
+    _required_detection_fields: tuple[str, ...] = ("language", "pattern")
 
     def __init__(self) -> None:
         """
@@ -194,15 +201,15 @@ class BaseRulesPipeline(BasePipeline):
         Raises:
             ValidationException: If required fields are missing
         """
-        required_fields = ["uuid", "name", "details", "detection"]
-        missing_fields = [field for field in required_fields if field not in rule_dict]
+        missing_fields = [field for field in self._required_fields if field not in rule_dict]
         if missing_fields:
             bastion_logger.warning(
                 f"Invalid rule, not all mandatory fields are present, file_path={file_path}, missing_fields={missing_fields}"
             )
             raise ValidationException()
-        detection_fields = ["language", "pattern"]
-        missing_detection_fields = [field for field in detection_fields if field not in rule_dict["detection"]]
+        missing_detection_fields = [
+            field for field in self._required_detection_fields if field not in rule_dict["detection"]
+        ]
         if missing_detection_fields:
             bastion_logger.warning(
                 f"Invalid rule, not all mandatory detection fields are present, file_path={file_path}, missing_detection_fields={missing_detection_fields}"
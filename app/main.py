@@ -1,10 +1,12 @@
 import asyncio
+import time
 from datetime import datetime
 
 from app.core.enums import ActionStatus
 from app.core.pipeline import BasePipeline
 from app.models.pipeline import PipelineResult, TaskResult
 from app.modules.kafka_client import KafkaClient
+from app.modules.logger import bastion_logger
 from app.utils import get_pipelines_from_config
 from settings import get_settings
 
@@ -55,6 +57,23 @@ class BastionApp:
             return ActionStatus.NOTIFY
         return ActionStatus.ALLOW
 
+    async def __run_pipeline(self, pipeline: BasePipeline, prompt: str) -> PipelineResult:
+        """
+        Runs a single pipeline and logs its execution time.
+
+        Args:
+            pipeline: Pipeline instance to execute
+            prompt: The text to be analyzed
+
+        Returns:
+            PipelineResult: Result returned by the pipeline
+        """
+        started = time.monotonic()
+        result = await pipeline.run(prompt)
+        elapsed_ms = (time.monotonic() - started) * 1000
+        bastion_logger.info(f"[{pipeline}] finished in {elapsed_ms:.1f} ms, status: {result.status}")
+        return result
+
     def __send_to_kafka(self, prompt: str, task: TaskResult, task_id: str | int | None = None):
         if not self.kafka_client:
             return
@@ -89,7 +108,7 @@ class BastionApp:
         pipelines = self.pipeline_flows.get(pipeline_flow, [])
         if not pipelines:
             return TaskResult(status=ActionStatus.ALLOW, pipelines=[])
-        pipeline_results = await asyncio.gather(*[pipeline.run(prompt) for pipeline in pipelines])
+        pipeline_results = await asyncio.gather(*[self.__run_pipeline(pipeline, prompt) for pipeline in pipelines])
         pipelines_result = [
             result for result in pipeline_results if result.status in (ActionStatus.BLOCK, ActionStatus.NOTIFY)
         ]
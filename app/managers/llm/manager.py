@@ -1,3 +1,5 @@
+import asyncio
+
 from app.core.enums import ActionStatus, ManagerNames
 from app.core.manager import BaseManager
 from app.managers.llm.clients import ALL_CLIENTS_MAP
@@ -45,19 +47,19 @@ class LLMManager(BaseManager[BaseLLMClient]):
     async def _check_connections(self) -> None:
         """
         Checks connections for all initialized clients.
-        Connection checks are deferred until the first async operation.
+        Checks run concurrently since each client is independent.
         """
         bastion_logger.debug("Checking connections for all initialized clients")
-        for client in self._clients_map.values():
-            try:
-                status = await client.check_connection()
-                if status:
-                    client.enabled = True
-                    bastion_logger.info(f"[{self}][{client}] Connection check successful")
-                else:
-                    bastion_logger.error(f"[{self}][{client}] Check connection failed")
-            except Exception as e:
-                bastion_logger.error(f"{str(e)}")
+        clients = list(self._clients_map.values())
+        statuses = await asyncio.gather(*[client.check_connection() for client in clients], return_exceptions=True)
+        for client, status in zip(clients, statuses):
+            if isinstance(status, Exception):
+                bastion_logger.error(f"{str(status)}")
+            elif status:
+                client.enabled = True
+                bastion_logger.info(f"[{self}][{client}] Connection check successful")
+            else:
+                bastion_logger.error(f"[{self}][{client}] Check connection failed")
 
     async def run(self, text: str) -> PipelineResult:
         """
@@ -1,12 +1,14 @@
 import asyncio
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional
 
 from app.core.exceptions import ConfigurationException
 from app.core.enums import RuleAction
 from app.models.pipeline import PipelineResult, TriggeredRuleData
 from app.modules.logger import bastion_logger
-from app.utils import text_embedding, split_text_into_sentences
+from app.utils import split_text_into_sentences, texts_embedding
 from settings import get_settings
 from scripts.similarity.const import INDEX_MAPPING
 
@@ -29,6 +31,8 @@ class BaseSearchClient(ABC):
 
     _identifier: str | None = None
     enabled: bool = False
+    _cache_max_size: int = 1024
+    _cache_ttl: float = 60.0
 
     def __init__(self, similarity_prompt_index: str, search_settings: Any) -> None:
         """
@@ -42,6 +46,7 @@ class BaseSearchClient(ABC):
         self._search_settings = search_settings
         self.notify_threshold = settings.SIMILARITY_NOTIFY_THRESHOLD
         self.block_threshold = settings.SIMILARITY_BLOCK_THRESHOLD
+        self._result_cache: OrderedDict[str, tuple[float, list[dict]]] = OrderedDict()
         self._client = self._initialize_client()
 
     def __str__(self) -> str:
@@ -122,16 +127,82 @@ class BaseSearchClient(ABC):
             error_msg = f"Failed to close pool of connections to {self}. Error: {e}"
             bastion_logger.exception(f"[{self._search_settings.host}] {error_msg}")
 
+    def _cache_get(self, chunk: str) -> Optional[list[dict]]:
+        """
+        Returns cached search results for a sentence chunk, if still fresh.
+
+        Args:
+            chunk (str): Sentence chunk used as cache key
+
+        Returns:
+            Optional[list[dict]]: Cached documents, or None on miss/expiry
+        """
+        entry = self._result_cache.get(chunk)
+        if entry is None:
+            return None
+        cached_at, documents = entry
+        if time.monotonic() - cached_at > self._cache_ttl:
+            del self._result_cache[chunk]
+            return None
+        self._result_cache.move_to_end(chunk)
+        # Copy so callers extending/mutating the list don't poison the cache
+        return list(documents)
+
+    def _cache_set(self, chunk: str, documents: list[dict]) -> None:
+        """
+        Stores search results for a sentence chunk, evicting the oldest entry
+        when the cache is full.
+
+        Args:
+            chunk (str): Sentence chunk used as cache key
+            documents (list[dict]): Formatted documents to cache
+        """
+        self._result_cache[chunk] = (time.monotonic(), list(documents))
+        self._result_cache.move_to_end(chunk)
+        while len(self._result_cache) > self._cache_max_size:
+            self._result_cache.popitem(last=False)
+
+    def invalidate_cache(self) -> None:
+        """
+        Drops all cached search results.
+
+        Called after indexing so new documents become visible immediately
+        instead of after the TTL expires.
+        """
+        self._result_cache.clear()
+
     async def index(self, body: Dict[str, Any]) -> bool:
         """
         Creates index.
         """
         try:
-            return await self._client.index(index=self.similarity_prompt_index, body=body)
+            result = await self._client.index(index=self.similarity_prompt_index, body=body)
+            self.invalidate_cache()
+            return result
         except Exception as e:
             bastion_logger.error(f"[{self}][{self._search_settings.host}][{self.similarity_prompt_index}] Failed to create index: {e}")
             return False
 
+    async def index_bulk(self, bodies: List[Dict[str, Any]]) -> int:
+        """
+        Indexes multiple documents.
+
+        Default implementation indexes the documents one by one. Clients
+        override this method when the backend supports a native bulk request
+        so the whole batch travels in a single round-trip.
+
+        Args:
+            bodies (List[Dict[str, Any]]): Documents to index
+
+        Returns:
+            int: Number of successfully indexed documents
+        """
+        indexed = 0
+        for body in bodies:
+            if await self.index(body):
+                indexed += 1
+        return indexed
+
     async def _search(self, index: str, body: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
         Executes search query to search system.
@@ -180,6 +251,24 @@ class BaseSearchClient(ABC):
         """
         raise NotImplementedError("Subclasses must implement this method")
 
+    async def search_similar_documents_batch(self, vectors: List[List[float]]) -> List[List[Dict[str, Any]]]:
+        """
+        Searches for similar documents for multiple vectors at once.
+
+        Default implementation fans the vectors out to search_similar_documents
+        concurrently. Clients override this method when the backend supports a
+        native multi-search request so the whole batch travels in a single
+        round-trip.
+
+        Args:
+            vectors (List[List[float]]): Query vectors to search for
+
+        Returns:
+            List[List[Dict[str, Any]]]: Search results per input vector,
+                                        in the same order as the vectors
+        """
+        return list(await asyncio.gather(*[self.search_similar_documents(vector) for vector in vectors]))
+
     async def _index_exists(self, index: str) -> bool:
         """
         Checks if index exists.
@@ -284,42 +373,42 @@ class BaseSearchClientMethods(BaseSearchClient):
             return RuleAction.BLOCK
         return RuleAction.NOTIFY
 
-    async def __search_similar_documents(self, chunk: str) -> list[dict]:
+    def _format_similar_documents(self, similar_documents: list[dict]) -> list[dict]:
         """
-        Search for similar documents using vector embeddings.
-
-        Converts text chunk to vector embedding and searches OpenSearch
-        for similar documents. Filters results by similarity threshold
-        and formats them for further processing.
+        Filters raw search hits by similarity threshold and formats them.
 
         Args:
-            chunk (str): Text chunk to search for similar content
+            similar_documents (list[dict]): Raw hits returned by the backend
 
         Returns:
             list[dict]: List of similar documents with metadata and scores
         """
-        vector = text_embedding(chunk)
-        similar_documents = await self.search_similar_documents(vector)
-        return [
-            {
-                "action": self._get_action(doc["_score"]),
-                "doc_id": doc["_source"].get("id"),
-                "name": doc["_source"].get("category"),
-                "details": doc["_source"]["details"],
-                "body": doc["_source"]["text"],
-                "score": doc["_score"],
-            }
-            for doc in similar_documents
-            if doc["_score"] > self.notify_threshold
-        ]
+        documents = []
+        for doc in similar_documents:
+            score = doc["_score"]
+            if score <= self.notify_threshold:
+                continue
+            source = doc["_source"]
+            documents.append(
+                {
+                    "action": self._get_action(score),
+                    "doc_id": source.get("id"),
+                    "name": source.get("category"),
+                    "details": source["details"],
+                    "body": source["text"],
+                    "score": score,
+                }
+            )
+        return documents
 
     async def run(self, text: str) -> PipelineResult:
         """
         Analyzes prompt for similar content using vector similarity search.
 
-        Splits the prompt into sentences, processes them in batches,
-        and searches for similar documents using vector embeddings.
-        Returns analysis results with triggered rules for similar content.
+        Splits the prompt into sentences, converts each batch of sentences
+        to vector embeddings and searches for similar documents with a single
+        batched backend request per batch. Returns analysis results with
+        triggered rules for similar content.
 
         Args:
             text (str): Text prompt to analyze for similar content
@@ -329,17 +418,36 @@ class BaseSearchClientMethods(BaseSearchClient):
         """
         similar_documents = []
         chunks = self.__split_prompt_into_sentences(text)
-        bastion_logger.info(f"Analyzing for {len(chunks)} sentences")
+        # Repeated sentences would trigger identical embeddings and searches;
+        # keep the first occurrence only (results are deduplicated downstream anyway)
+        chunks = list(dict.fromkeys(chunks))
+        # Lazy %-formatting: fires on every request, so skip string building
+        # when the level is off
+        bastion_logger.debug("Analyzing for %d sentences", len(chunks))
+
+        # Recently analyzed sentences skip the embedding and search entirely
+        uncached_chunks = []
+        for chunk in chunks:
+            cached = self._cache_get(chunk)
+            if cached is not None:
+                similar_documents.extend(cached)
+            else:
+                uncached_chunks.append(chunk)
 
         batch_size = 5
-        for i in range(0, len(chunks), batch_size):
-            batch = chunks[i : i + batch_size]
-            tasks = [self.__search_similar_documents(chunk) for chunk in batch]
-            batch_results = await asyncio.gather(*tasks)
-            for result in batch_results:
-                similar_documents.extend(result)
+        for i in range(0, len(uncached_chunks), batch_size):
+            batch = uncached_chunks[i : i + batch_size]
+            # Embedding is CPU-bound; run it in a worker thread so the event
+            # loop keeps serving other requests while the model encodes.
+            # The whole batch is encoded in one forward pass.
+            vectors = await asyncio.to_thread(texts_embedding, batch)
+            batch_results = await self.search_similar_documents_batch(vectors)
+            for chunk, result in zip(batch, batch_results):
+                documents = self._format_similar_documents(result)
+                self._cache_set(chunk, documents)
+                similar_documents.extend(documents)
         triggered_rules = await self.prepare_triggered_rules(similar_documents)
-        bastion_logger.info(f"Found {len(triggered_rules)} similar documents")
+        bastion_logger.debug("Found %d similar documents", len(triggered_rules))
         return PipelineResult(
             name=str(self), status=self._pipeline_status(triggered_rules), triggered_rules=triggered_rules
         )
@@ -355,3 +463,42 @@ class BaseSearchClientMethods(BaseSearchClient):
         except Exception as e:
             bastion_logger.error(f"[{self}][{self._search_settings.host}][{self.similarity_prompt_index}] Failed to create index: {e}")
             return False
+
+    async def index_bulk(self, bodies: List[Dict[str, Any]]) -> int:
+        """
+        Indexes multiple documents with a single bulk request.
+
+        Builds an NDJSON-style bulk body so the whole batch travels in one
+        round-trip instead of one index request per document. Falls back to
+        per-document indexing if the bulk request fails.
+
+        Args:
+            bodies (List[Dict[str, Any]]): Documents to index
+
+        Returns:
+            int: Number of successfully indexed documents
+        """
+        if not bodies:
+            return 0
+
+        bulk_body = []
+        for body in bodies:
+            bulk_body.append({"index": {"_index": self.similarity_prompt_index}})
+            bulk_body.append(body)
+
+        try:
+            resp = await self._client.bulk(body=bulk_body)
+        except Exception as e:
+            bastion_logger.error(f"[{self}][{self._search_settings.host}][{self.similarity_prompt_index}] Bulk indexing failed, falling back: {e}")
+            return await super().index_bulk(bodies)
+
+        self.invalidate_cache()
+        indexed = sum(
+            1 for item in resp.get("items", []) if not item.get("index", {}).get("error")
+        )
+        if resp.get("errors"):
+            bastion_logger.error(
+                f"[{self}][{self.similarity_prompt_index}] Bulk indexing finished with errors: "
+                f"{indexed}/{len(bodies)} documents indexed"
+            )
+        return indexed
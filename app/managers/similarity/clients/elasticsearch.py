@@ -1,6 +1,4 @@
-from typing import Any, Dict, List
-
-from elasticsearch import AsyncElasticsearch
+from typing import TYPE_CHECKING, Any, Dict, List
 
 from app.managers.similarity.clients.base import BaseSearchClientMethods
 from app.models.pipeline import TriggeredRuleData
@@ -9,6 +7,12 @@ from app.core.enums import SimilarityClientNames
 from settings import get_settings
 from scripts.similarity.const import INDEX_MAPPING_NO_KNN
 
+if TYPE_CHECKING:
+    from elasticsearch import AsyncElasticsearch
+
+
+settings = get_settings()
+
 
 class AsyncElasticsearchClient(BaseSearchClientMethods):
     """
@@ -26,7 +30,6 @@ class AsyncElasticsearchClient(BaseSearchClientMethods):
         """
         Initializes Elasticsearch client with connection settings.
         """
-        settings = get_settings()
         if not settings.ES:
             raise Exception("Elasticsearch settings are not specified in environment variables")
 
@@ -35,13 +38,18 @@ class AsyncElasticsearchClient(BaseSearchClientMethods):
     def __str__(self) -> str:
         return "Elasticsearch Client"
 
-    def _initialize_client(self) -> AsyncElasticsearch:
+    def _initialize_client(self) -> "AsyncElasticsearch":
         """
         Initializes Elasticsearch client with specific configuration.
 
+        The elasticsearch import lives here so deployments using another
+        backend never load the library.
+
         Returns:
             AsyncElasticsearch: Initialized Elasticsearch client
         """
+        from elasticsearch import AsyncElasticsearch
+
         config = self._search_settings.get_client_config()
         return AsyncElasticsearch(**config)
 
@@ -84,11 +92,12 @@ class AsyncElasticsearchClient(BaseSearchClientMethods):
             }
         }
 
-        # Log the query for debugging
+        # Log the query for debugging (lazy %-formatting: the query body is
+        # large and only rendered when DEBUG is on)
         bastion_logger.debug(
-            f"[{self.similarity_prompt_index}] Executing similarity search with vector length: {len(vector)}"
+            "[%s] Executing similarity search with vector length: %d", self.similarity_prompt_index, len(vector)
         )
-        bastion_logger.debug(f"[{self.similarity_prompt_index}] Query body: {body}")
+        bastion_logger.debug("[%s] Query body: %s", self.similarity_prompt_index, body)
 
         try:
             # Check if index exists before searching
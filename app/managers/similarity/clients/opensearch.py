@@ -1,5 +1,4 @@
-from typing import Any, Dict, List
-from opensearchpy import AsyncOpenSearch
+from typing import TYPE_CHECKING, Any, Dict, List
 
 from app.managers.similarity.clients.base import BaseSearchClientMethods
 from app.models.pipeline import TriggeredRuleData
@@ -7,6 +6,12 @@ from app.modules.logger import bastion_logger
 from app.core.enums import SimilarityClientNames
 from settings import get_settings
 
+if TYPE_CHECKING:
+    from opensearchpy import AsyncOpenSearch
+
+
+settings = get_settings()
+
 
 class AsyncOpenSearchClient(BaseSearchClientMethods):
     """
@@ -24,7 +29,6 @@ class AsyncOpenSearchClient(BaseSearchClientMethods):
         """
         Initializes OpenSearch client with connection settings.
         """
-        settings = get_settings()
         if not settings.OS:
             raise Exception("OpenSearch settings are not specified in environment variables")
 
@@ -33,13 +37,18 @@ class AsyncOpenSearchClient(BaseSearchClientMethods):
     def __str__(self) -> str:
         return "OpenSearch Client"
 
-    def _initialize_client(self) -> AsyncOpenSearch:
+    def _initialize_client(self) -> "AsyncOpenSearch":
         """
         Initializes OpenSearch client with specific configuration.
 
+        The opensearchpy import lives here so deployments using another
+        backend never load the library.
+
         Returns:
             AsyncOpenSearch: Initialized OpenSearch client
         """
+        from opensearchpy import AsyncOpenSearch
+
         return AsyncOpenSearch(**self._search_settings.get_client_config())
 
     async def search_similar_documents(self, vector: List[float]) -> List[Dict[str, Any]]:
@@ -67,14 +76,20 @@ class AsyncOpenSearchClient(BaseSearchClientMethods):
                 f"[{self.similarity_prompt_index}] Vector dimension mismatch: expected 768, got {len(vector)}"
             )
 
-        # Use KNN query for vector similarity search
-        body = {"size": 5, "query": {"knn": {"vector": {"vector": vector, "k": 5}}}}
+        # Use KNN query for vector similarity search; min_score makes the server
+        # drop hits below the notify threshold instead of shipping them back
+        body = {
+            "size": 5,
+            "min_score": self.notify_threshold,
+            "query": {"knn": {"vector": {"vector": vector, "k": 5}}},
+        }
 
-        # Log the query for debugging
+        # Log the query for debugging (lazy %-formatting: the query body is
+        # large and only rendered when DEBUG is on)
         bastion_logger.debug(
-            f"[{self.similarity_prompt_index}] Executing similarity search with vector length: {len(vector)}"
+            "[%s] Executing similarity search with vector length: %d", self.similarity_prompt_index, len(vector)
         )
-        bastion_logger.debug(f"[{self.similarity_prompt_index}] Query body: {body}")
+        bastion_logger.debug("[%s] Query body: %s", self.similarity_prompt_index, body)
 
         try:
             # Check if index exists before searching
@@ -87,11 +102,7 @@ class AsyncOpenSearchClient(BaseSearchClientMethods):
 
         resp = await self._search(index=self.similarity_prompt_index, body=body)
         if resp:
-            documents = {}
-            for hit in resp.get("hits", {}).get("hits", []):
-                if hit["_source"]["category"] not in documents:
-                    documents[hit["_source"]["category"]] = hit
-            return list(documents.values())
+            return self._group_hits_by_category(resp)
 
         # Fallback: try simpler KNN query if the main one failed
         bastion_logger.warning(f"[{self.similarity_prompt_index}] Main KNN query failed, trying fallback")
@@ -99,15 +110,73 @@ class AsyncOpenSearchClient(BaseSearchClientMethods):
 
         fallback_resp = await self._search(index=self.similarity_prompt_index, body=fallback_body)
         if fallback_resp:
-            documents = {}
-            for hit in fallback_resp.get("hits", {}).get("hits", []):
-                if hit["_source"]["category"] not in documents:
-                    documents[hit["_source"]["category"]] = hit
-            return list(documents.values())
+            return self._group_hits_by_category(fallback_resp)
 
         bastion_logger.error(f"[{self.similarity_prompt_index}] Failed to search similar documents - no response")
         return []
 
+    async def search_similar_documents_batch(self, vectors: List[List[float]]) -> List[List[Dict[str, Any]]]:
+        """
+        Searches for similar documents for multiple vectors in one request.
+
+        Uses the OpenSearch multi-search API so a whole batch of KNN queries
+        travels in a single HTTP round-trip instead of one request per vector.
+        Falls back to per-vector searches if the multi-search request fails.
+
+        Args:
+            vectors (List[List[float]]): Query vectors to search for
+
+        Returns:
+            List[List[Dict[str, Any]]]: Search results per input vector,
+                                        in the same order as the vectors
+        """
+        if not vectors:
+            return []
+
+        try:
+            if not await self._index_exists(self.similarity_prompt_index):
+                bastion_logger.warning(f"[{self.similarity_prompt_index}] Index does not exist")
+                return [[] for _ in vectors]
+        except Exception as e:
+            bastion_logger.error(f"[{self.similarity_prompt_index}] Failed to check index existence: {e}")
+            return [[] for _ in vectors]
+
+        body = []
+        for vector in vectors:
+            body.append({"index": self.similarity_prompt_index})
+            body.append(
+                {
+                    "size": 5,
+                    "min_score": self.notify_threshold,
+                    "query": {"knn": {"vector": {"vector": vector, "k": 5}}},
+                }
+            )
+
+        try:
+            resp = await self._client.msearch(body=body)
+        except Exception as e:
+            bastion_logger.error(f"[{self.similarity_prompt_index}] Multi-search failed, falling back: {e}")
+            return await super().search_similar_documents_batch(vectors)
+
+        return [self._group_hits_by_category(response) for response in resp.get("responses", [])]
+
+    @staticmethod
+    def _group_hits_by_category(resp: dict) -> List[Dict[str, Any]]:
+        """
+        Groups search hits by category, keeping the first (best) hit per category.
+
+        Args:
+            resp (dict): Raw search response from OpenSearch
+
+        Returns:
+            List[Dict[str, Any]]: Deduplicated hits, one per category
+        """
+        documents = {}
+        for hit in resp.get("hits", {}).get("hits", []):
+            if hit["_source"]["category"] not in documents:
+                documents[hit["_source"]["category"]] = hit
+        return list(documents.values())
+
     async def prepare_triggered_rules(self, similar_documents: list[dict]) -> list[TriggeredRuleData]:
         """
         Prepare rules with deduplication by doc_id.
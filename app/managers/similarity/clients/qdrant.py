@@ -1,7 +1,4 @@
-from typing import Any, Dict, List
-
-from qdrant_client import AsyncQdrantClient
-from qdrant_client.models import Distance, VectorParams, PointStruct, Filter, FieldCondition, MatchValue, ScoredPoint
+from typing import TYPE_CHECKING, Any, Dict, List
 
 from app.managers.similarity.clients.base import BaseSearchClientMethods
 from app.models.pipeline import TriggeredRuleData
@@ -9,6 +6,13 @@ from app.modules.logger import bastion_logger
 from app.core.enums import SimilarityClientNames
 from settings import get_settings
 
+if TYPE_CHECKING:
+    from qdrant_client import AsyncQdrantClient
+    from qdrant_client.models import ScoredPoint
+
+
+settings = get_settings()
+
 
 class AsyncQdrantClientWrapper(BaseSearchClientMethods):
     """
@@ -27,12 +31,12 @@ class AsyncQdrantClientWrapper(BaseSearchClientMethods):
 
     _identifier: SimilarityClientNames = SimilarityClientNames.qdrant
     description = "Qdrant-based client for high-performance similarity search operations using vector embeddings."
+    _collection_known_to_exist: bool = False
 
     def __init__(self) -> None:
         """
         Initializes Qdrant client with connection settings.
         """
-        settings = get_settings()
         if not settings.QDRANT:
             raise Exception("Qdrant settings are not specified in environment variables")
 
@@ -41,13 +45,18 @@ class AsyncQdrantClientWrapper(BaseSearchClientMethods):
     def __str__(self) -> str:
         return "Qdrant Client"
 
-    def _initialize_client(self) -> AsyncQdrantClient:
+    def _initialize_client(self) -> "AsyncQdrantClient":
         """
         Initializes Qdrant client with specific configuration.
 
+        The qdrant_client import lives here so deployments using another
+        backend never load the library.
+
         Returns:
             AsyncQdrantClient: Initialized Qdrant client
         """
+        from qdrant_client import AsyncQdrantClient
+
         return AsyncQdrantClient(**self._search_settings.get_client_config())
 
     async def _ping(self) -> bool:
@@ -69,15 +78,24 @@ class AsyncQdrantClientWrapper(BaseSearchClientMethods):
         """
         Checks if collection exists in Qdrant.
 
+        Uses collection_exists, a single dedicated RPC, instead of listing
+        all collections and scanning the names. A positive answer is cached:
+        collections are never dropped at runtime, so once seen the check
+        costs nothing on the search path.
+
         Args:
             collection_name (str): Name of the collection to check
 
         Returns:
             bool: True if collection exists, False otherwise
         """
+        if self._collection_known_to_exist:
+            return True
         try:
-            collections = await self._client.get_collections()
-            return any(col.name == collection_name for col in collections.collections)
+            exists = await self._client.collection_exists(collection_name)
+            if exists:
+                self._collection_known_to_exist = True
+            return exists
         except Exception as e:
             bastion_logger.error(f"[{self._search_settings.host}][{collection_name}] Failed to check collection existence: {e}")
             return False
@@ -106,9 +124,9 @@ class AsyncQdrantClientWrapper(BaseSearchClientMethods):
                 f"[{self.similarity_prompt_index}] Vector dimension mismatch: expected 768, got {len(vector)}"
             )
 
-        # Log the query for debugging
+        # Log the query for debugging (lazy %-formatting: fires per query)
         bastion_logger.debug(
-            f"[{self.similarity_prompt_index}] Executing similarity search with vector length: {len(vector)}"
+            "[%s] Executing similarity search with vector length: %d", self.similarity_prompt_index, len(vector)
         )
 
         try:
@@ -122,34 +140,93 @@ class AsyncQdrantClientWrapper(BaseSearchClientMethods):
 
         try:
             # Perform vector search with score threshold
-            results: List[ScoredPoint] = await self._client.search(
+            results: List["ScoredPoint"] = await self._client.search(
                 collection_name=self.similarity_prompt_index,
                 query_vector=vector,
                 limit=5,
                 score_threshold=self.notify_threshold,  # Built-in threshold filtering
             )
 
-            # Deduplicate by category - keep only the best match per category
-            documents = {}
-            for point in results:
-                category = point.payload.get("category")
-                if category not in documents:
-                    documents[category] = {
-                        "_score": point.score,
-                        "_source": {
-                            "id": point.payload.get("id"),
-                            "category": category,
-                            "details": point.payload.get("details", ""),
-                            "text": point.payload.get("text", ""),
-                        }
-                    }
-
-            return list(documents.values())
+            return self._group_points_by_category(results)
 
         except Exception as e:
             bastion_logger.error(f"[{self.similarity_prompt_index}] Failed to search similar documents: {e}")
             return []
 
+    async def search_similar_documents_batch(self, vectors: List[List[float]]) -> List[List[Dict[str, Any]]]:
+        """
+        Searches for similar documents for multiple vectors in one request.
+
+        Uses Qdrant's native batch search so a whole batch of vector queries
+        travels in a single round-trip instead of one request per vector.
+        Falls back to per-vector searches if the batch request fails.
+
+        Args:
+            vectors (List[List[float]]): Query vectors to search for
+
+        Returns:
+            List[List[Dict[str, Any]]]: Search results per input vector,
+                                        in the same order as the vectors
+        """
+        if not vectors:
+            return []
+
+        try:
+            if not await self._index_exists(self.similarity_prompt_index):
+                bastion_logger.warning(f"[{self.similarity_prompt_index}] Collection does not exist")
+                return [[] for _ in vectors]
+        except Exception as e:
+            bastion_logger.error(f"[{self.similarity_prompt_index}] Failed to check collection existence: {e}")
+            return [[] for _ in vectors]
+
+        from qdrant_client.models import SearchRequest
+
+        requests = [
+            SearchRequest(
+                vector=vector,
+                limit=5,
+                score_threshold=self.notify_threshold,
+                with_payload=True,
+            )
+            for vector in vectors
+        ]
+
+        try:
+            batch_results = await self._client.search_batch(
+                collection_name=self.similarity_prompt_index, requests=requests
+            )
+        except Exception as e:
+            bastion_logger.error(f"[{self.similarity_prompt_index}] Batch search failed, falling back: {e}")
+            return await super().search_similar_documents_batch(vectors)
+
+        return [self._group_points_by_category(points) for points in batch_results]
+
+    @staticmethod
+    def _group_points_by_category(points: List["ScoredPoint"]) -> List[Dict[str, Any]]:
+        """
+        Groups scored points by category, keeping the best match per category.
+
+        Args:
+            points (List[ScoredPoint]): Scored points returned by Qdrant
+
+        Returns:
+            List[Dict[str, Any]]: Deduplicated hits, one per category
+        """
+        documents = {}
+        for point in points:
+            category = point.payload.get("category")
+            if category not in documents:
+                documents[category] = {
+                    "_score": point.score,
+                    "_source": {
+                        "id": point.payload.get("id"),
+                        "category": category,
+                        "details": point.payload.get("details", ""),
+                        "text": point.payload.get("text", ""),
+                    }
+                }
+        return list(documents.values())
+
     async def index_create(self) -> bool:
         """
         Creates a new collection in Qdrant with vector configuration.
@@ -157,6 +234,8 @@ class AsyncQdrantClientWrapper(BaseSearchClientMethods):
         Returns:
             bool: True if collection was created successfully, False otherwise
         """
+        from qdrant_client.models import Distance, VectorParams
+
         try:
             await self._client.create_collection(
                 collection_name=self.similarity_prompt_index,
@@ -165,6 +244,7 @@ class AsyncQdrantClientWrapper(BaseSearchClientMethods):
                     distance=Distance.COSINE,  # Cosine similarity
                 ),
             )
+            self._collection_known_to_exist = True
             bastion_logger.info(f"[{self}][{self._search_settings.host}][{self.similarity_prompt_index}] Collection created successfully")
             return True
         except Exception as e:
@@ -181,6 +261,8 @@ class AsyncQdrantClientWrapper(BaseSearchClientMethods):
         Returns:
             bool: True if indexing was successful, False otherwise
         """
+        from qdrant_client.models import PointStruct
+
         try:
             point = PointStruct(
                 id=body.get("id"),
@@ -198,13 +280,57 @@ class AsyncQdrantClientWrapper(BaseSearchClientMethods):
                 points=[point]
             )
 
-            bastion_logger.debug(f"[{self.similarity_prompt_index}] Indexed document: {body.get('id')}")
+            self.invalidate_cache()
+            bastion_logger.debug("[%s] Indexed document: %s", self.similarity_prompt_index, body.get("id"))
             return True
 
         except Exception as e:
             bastion_logger.error(f"[{self}][{self._search_settings.host}][{self.similarity_prompt_index}] Failed to index document: {e}")
             return False
 
+    async def index_bulk(self, bodies: List[Dict[str, Any]]) -> int:
+        """
+        Indexes multiple documents with a single batched upsert.
+
+        Qdrant accepts batches of points in one upsert call, so the whole
+        batch travels in a single round-trip instead of one upsert per
+        document. Falls back to per-document indexing if the batch fails.
+
+        Args:
+            bodies (List[Dict[str, Any]]): Documents to index with keys: id, vector, text, category, details
+
+        Returns:
+            int: Number of successfully indexed documents
+        """
+        if not bodies:
+            return 0
+
+        from qdrant_client.models import PointStruct
+
+        points = [
+            PointStruct(
+                id=body.get("id"),
+                vector=body.get("vector"),
+                payload={
+                    "id": body.get("id"),
+                    "text": body.get("text"),
+                    "category": body.get("category", ""),
+                    "details": body.get("details", ""),
+                }
+            )
+            for body in bodies
+        ]
+
+        try:
+            await self._client.upsert(collection_name=self.similarity_prompt_index, points=points)
+        except Exception as e:
+            bastion_logger.error(f"[{self}][{self._search_settings.host}][{self.similarity_prompt_index}] Batch upsert failed, falling back: {e}")
+            return await super().index_bulk(bodies)
+
+        self.invalidate_cache()
+        bastion_logger.debug("[%s] Indexed %d documents in one batch", self.similarity_prompt_index, len(points))
+        return len(points)
+
     async def prepare_triggered_rules(self, similar_documents: list[dict]) -> list[TriggeredRuleData]:
         """
         Prepare rules with deduplication by doc_id.
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any, Dict
 
 from app.core.enums import ActionStatus, ManagerNames
@@ -47,19 +48,19 @@ class SimilarityManager(BaseManager[BaseSearchClient]):
     async def _check_connections(self) -> None:
         """
         Checks connections for all initialized clients.
-        Connection checks are deferred until the first async operation.
+        Checks run concurrently since each client is independent.
         """
         bastion_logger.debug("Checking connections for all initialized clients")
-        for client in self._clients_map.values():
-            try:
-                status = await client.check_connection()
-                if status:
-                    client.enabled = True
-                    bastion_logger.info(f"[{self}][{client}] Connection check successful")
-                else:
-                    bastion_logger.error(f"[{self}][{client}] Check connection failed")
-            except Exception as e:
-                bastion_logger.error(f"{str(e)}")
+        clients = list(self._clients_map.values())
+        statuses = await asyncio.gather(*[client.check_connection() for client in clients], return_exceptions=True)
+        for client, status in zip(clients, statuses):
+            if isinstance(status, Exception):
+                bastion_logger.error(f"{str(status)}")
+            elif status:
+                client.enabled = True
+                bastion_logger.info(f"[{self}][{client}] Connection check successful")
+            else:
+                bastion_logger.error(f"[{self}][{client}] Check connection failed")
 
     @property
     def index_name(self) -> str:
@@ -74,6 +75,9 @@ class SimilarityManager(BaseManager[BaseSearchClient]):
     async def index(self, body: Dict[str, Any]) -> bool:
         return await self._active_client.index(body)
 
+    async def index_bulk(self, bodies: list[Dict[str, Any]]) -> int:
+        return await self._active_client.index_bulk(bodies)
+
     async def index_create(self) -> bool:
         return await self._active_client.index_create()
 
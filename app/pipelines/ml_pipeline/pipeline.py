@@ -1,5 +1,3 @@
-import joblib
-
 from app.core.enums import ActionStatus, PipelineNames, RuleAction
 from app.core.pipeline import BasePipeline
 from app.models.pipeline import PipelineResult, TriggeredRuleData
@@ -57,6 +55,10 @@ class MLPipeline(BasePipeline):
         if not settings.ML_MODEL_PATH:
             return None
         try:
+            # Imported lazily so deployments without an ML model do not pay
+            # for the joblib/scipy import chain at startup.
+            import joblib
+
             return joblib.load(settings.ML_PIPELINE_PATH)
         except Exception as err:
             bastion_logger.error(f"Error loading model, error={str(err)}")
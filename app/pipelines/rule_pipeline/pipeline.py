@@ -1,6 +1,7 @@
 import re
 from pathlib import Path
 
+from app.core.dataclasses import Rule
 from app.core.enums import PipelineNames
 from app.core.exceptions import ValidationException
 from app.core.pipeline import BaseRulesPipeline
@@ -26,6 +27,18 @@ class RulePipeline(BaseRulesPipeline):
     description = "Regular expression-based pipeline for pattern matching in prompts."
     _rules_dir_path = str(Path(__file__).parent / "rules")
 
+    def __init__(self) -> None:
+        """
+        Initializes the pipeline and precompiles loaded regex patterns.
+
+        Patterns are compiled once at load time so that prompt analysis
+        does not pay regex compilation cost on every request.
+        """
+        super().__init__()
+        self._compiled_rules: list[tuple[re.Pattern, Rule]] = [
+            (re.compile(rule.body, re.IGNORECASE | re.DOTALL), rule) for rule in self._rules
+        ]
+
     def _validate_rule_dict(self, rule_dict: dict, file_path: str) -> None:
         """
         Validates regex rule dictionary and compiles patterns.
@@ -65,8 +78,8 @@ class RulePipeline(BaseRulesPipeline):
         """
         triggered_rules = []
         bastion_logger.info(f"Analyzing for {len(self._rules)} rules")
-        for rule in self._rules:
-            if re.search(rule.body, prompt):
+        for pattern, rule in self._compiled_rules:
+            if pattern.search(prompt):
                 triggered_rules.append(
                     TriggeredRuleData(
                         id=rule.id, name=rule.name, details=rule.details, body=rule.body, action=rule.action
@@ -12,8 +12,6 @@ except LookupError:
 
 from typing import TYPE_CHECKING
 
-from sentence_transformers import SentenceTransformer
-
 from app.modules.logger import bastion_logger
 from settings import get_settings
 
@@ -26,6 +24,10 @@ settings = get_settings()
 model = None
 if settings.EMBEDDINGS_MODEL:
     try:
+        # Imported lazily: sentence_transformers pulls in torch, which is only
+        # needed when an embeddings model is actually configured.
+        from sentence_transformers import SentenceTransformer
+
         model = SentenceTransformer(settings.EMBEDDINGS_MODEL, trust_remote_code=True, revision="main")
     except Exception as e:
         bastion_logger.error(f"Failed to load embeddings model: {e}")
@@ -80,6 +82,26 @@ def text_embedding(prompt: str) -> list[float]:
     return model.encode(prompt, normalize_embeddings=True).tolist()
 
 
+def texts_embedding(prompts: list[str]) -> list[list[float]]:
+    """
+    Create vector embeddings for multiple texts in a single encode call.
+
+    Encoding a whole batch at once lets the model process all texts in one
+    forward pass instead of one pass per text.
+
+    Args:
+        prompts: Texts to convert to vectors
+
+    Returns:
+        List of embedding vectors, one per input text
+    """
+    if model is None:
+        raise ValueError("Embeddings model is not loaded. Please check EMBEDDINGS_MODEL setting.")
+    if not prompts:
+        return []
+    return model.encode(prompts, normalize_embeddings=True).tolist()
+
+
 def split_text_into_sentences(text: str) -> list[str]:
     """
     Split text into sentences with support for Western and Eastern European languages.
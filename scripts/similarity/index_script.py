@@ -10,7 +10,7 @@ sys.path.insert(0, str(project_root))
 from app.managers import ALL_MANAGERS_MAP  # noqa: E402
 from app.managers.similarity.manager import SimilarityManager  # noqa: E402
 from app.modules.logger import bastion_logger  # noqa: E402
-from app.utils import text_embedding  # noqa: E402
+from app.utils import texts_embedding  # noqa: E402
 from scripts.similarity.const import PROMPTS_EXAMPLES  # noqa: E402
 from settings import get_settings  # noqa: E402
 
@@ -56,12 +56,13 @@ class CreateSearchIndex:
                     return False
 
             docs = [asdict(doc) for doc in PROMPTS_EXAMPLES]
-            for doc in docs:
-                doc["vector"] = text_embedding(doc["text"])
-                await self.similarity_manager.index(body=doc)
+            vectors = texts_embedding([doc["text"] for doc in docs])
+            for doc, vector in zip(docs, vectors):
+                doc["vector"] = vector
+            indexed = await self.similarity_manager.index_bulk(docs)
 
-            bastion_logger.info(f"Uploaded {len(docs)} example prompts to index")
-            return True
+            bastion_logger.info(f"Uploaded {indexed} example prompts to index")
+            return indexed == len(docs)
 
         except Exception as e:
             bastion_logger.error(f"Error uploading prompts: {e}")
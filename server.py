@@ -1,9 +1,12 @@
+import asyncio
 from contextlib import asynccontextmanager
 
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
+from app.main import bastion_app
 from app.managers import ALL_MANAGERS_MAP
 from app.modules.logger import bastion_logger
 from app.pipelines import PIPELINES_MAP
@@ -16,11 +19,11 @@ settings = get_settings()
 
 @asynccontextmanager
 async def lifespan(app_: FastAPI):
-    for pipeline in PIPELINES_MAP.values():
-        await pipeline.activate()
+    # Pipelines are independent, so activate them concurrently: startup
+    # takes as long as the slowest warmup instead of the sum of all
+    await asyncio.gather(*[pipeline.activate() for pipeline in PIPELINES_MAP.values()])
     yield
-    for manager in ALL_MANAGERS_MAP.values():
-        await manager.close_connections()
+    await asyncio.gather(*[manager.close_connections() for manager in ALL_MANAGERS_MAP.values()])
 
 
 app = FastAPI(
@@ -29,11 +32,35 @@ app = FastAPI(
     description="API for LLM Protection",
     version="1.0.0",
     prefix="/api/v1",
+    # orjson serializes responses noticeably faster than stdlib json
+    default_response_class=ORJSONResponse,
 )
 
 app.include_router(flow_router)
 app.include_router(manager_router)
 
+
+@app.get("/health", tags=["Health"])
+async def get_health() -> dict:
+    """
+    Aggregated health summary for the service.
+
+    Returns flow, pipeline and manager status in a single response so
+    monitoring clients do not need separate round-trips to /flow/list
+    and /manager/list.
+    """
+    pipelines = PIPELINES_MAP.values()
+    managers = ALL_MANAGERS_MAP.values()
+    return {
+        "service": settings.PROJECT_NAME,
+        "version": settings.VERSION,
+        "flows": len(bastion_app.pipeline_flows),
+        "active_pipelines": sum(1 for pipeline in pipelines if pipeline.enabled),
+        "total_pipelines": len(pipelines),
+        "active_managers": sum(1 for manager in managers if manager.has_active_client),
+        "total_managers": len(managers),
+    }
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.CORS_ORIGINS,
@@ -23,6 +23,7 @@ class BaseSearchSettings(BaseModel):
     port: int
     scheme: str = "https"
     pool_size: int = 10
+    timeout: int = 10
 
     def get_common_config(self) -> dict:
         """
@@ -37,6 +38,7 @@ class BaseSearchSettings(BaseModel):
             "ssl_show_warn": False,
             "retry_on_status": (500, 502, 503, 504),
             "max_retries": 3,
+            "timeout": self.timeout,
         }
 
         if self.user and self.password:
@@ -57,6 +59,7 @@ class ElasticsearchSettings(BaseSearchSettings):
     def get_client_config(self) -> dict:
         config = {
             "hosts": [f"{self.scheme}://{self.host}:{self.port}"],
+            "request_timeout": self.timeout,
         }
 
         # Add authentication only if both user and password are provided